@@ -16,6 +16,12 @@ func _ready():
 	graph.grab_focus()
 
 
+func _exit_tree():
+	if wisp:
+		wisp.deinit()
+		wisp = null
+
+
 func _on_flow_graph_node_selected(node):
 	if node is FlowGraphNode:
 		$PropertyInspector.flow_node = node.flow_node
@@ -116,6 +116,13 @@ impl TwistedWisp {
         self.runner_mut().dsp_stop();
     }
 
+    #[func]
+    fn deinit(&mut self) {
+        if let Some(runner) = self.runner.take() {
+            runner.deinit();
+        }
+    }
+
     #[func]
     fn create_flow(&mut self) -> Gd<TwistedWispFlow> {
         let ctx = self.ctx_mut();
@@ -233,6 +240,15 @@ impl TwistedWisp {
     }
 }
 
+impl Drop for TwistedWisp {
+    // Best-effort fallback in case deinit() was never called
+    fn drop(&mut self) {
+        if let Some(runner) = self.runner.take() {
+            runner.deinit();
+        }
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
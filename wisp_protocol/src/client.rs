@@ -15,6 +15,7 @@ use crate::{
 pub struct WispRunnerClient {
     wisp_process: Child,
     reader: BufReader<ChildStdout>,
+    response_line: String,
 }
 
 impl WispRunnerClient {
@@ -46,6 +47,7 @@ impl WispRunnerClient {
         WispRunnerClient {
             wisp_process: child,
             reader: BufReader::new(stdout),
+            response_line: String::new(),
         }
     }
 
@@ -68,11 +70,11 @@ impl WispRunnerClient {
             .unwrap()
             .write_all(command.as_bytes())
             .expect("Failed to run a command");
-        let mut line = String::new();
+        self.response_line.clear();
         self.reader
-            .read_line(&mut line)
+            .read_line(&mut self.response_line)
             .expect("Failed to receive the response");
-        WispCommandResponse::<T>::from_json(&line).unwrap()
+        WispCommandResponse::<T>::from_json(&self.response_line).unwrap()
     }
 
     pub fn get_system_info(&mut self) -> SystemInfo {
@@ -68,8 +68,16 @@ impl SignalProcessor {
 
     pub fn process(&mut self, output: &mut [f32]) {
         // TODO: Return error instead?
-        assert_eq!(0, output.len() % self.num_outputs);
-        for chunk in output.chunks_mut(self.num_outputs) {
+        debug_assert_eq!(0, output.len() % self.num_outputs);
+        if self.watches.is_empty() {
+            // No per-tick bookkeeping needed, process the whole buffer in one go
+            for chunk in output.chunks_exact_mut(self.num_outputs) {
+                self.process_one(chunk);
+            }
+            self.elapsed_ticks += (output.len() / self.num_outputs) as u32;
+            return;
+        }
+        for chunk in output.chunks_exact_mut(self.num_outputs) {
             // Capture watch values before processing to have 0-based sample index
             for watch in &mut self.watches.values_mut() {
                 if self.elapsed_ticks % watch.rate == 0 {
@@ -217,19 +225,15 @@ impl SignalProcessor {
 
     pub fn query_watched_data_value(&mut self) -> WatchedDataValues {
         let mut values = HashMap::new();
+        // NaNs are serialized as nulls and can't be deserialized as f32, easier to zero them out
+        let zero_nan = |v: f32| if v.is_nan() { 0.0 } else { v };
         for (idx, watch) in &mut self.watches {
-            let mut history = match watch.data {
+            let history = match watch.data {
                 WatchedData::LastValue(v) => {
-                    vec![v]
+                    vec![zero_nan(v)]
                 }
-                WatchedData::Buffer(ref mut buffer) => buffer.drain().collect(),
+                WatchedData::Buffer(ref mut buffer) => buffer.drain().map(zero_nan).collect(),
             };
-            // NaNs are serialized as nulls and can't be deserialized as f32, easier to zero them out
-            for v in history.iter_mut() {
-                if v.is_nan() {
-                    *v = 0.0;
-                }
-            }
             values.insert(*idx, history);
         }
         WatchedDataValues { values }
@@ -60,6 +60,7 @@ enum RuntimeStateMessage {
 }
 
 enum SignalProcessorResponse {
+    Ack,
     Watch(Option<WatchIndex>),
     WatchData(WatchedDataValues),
 }
@@ -82,9 +83,10 @@ struct RuntimeState {
 
 impl<'ectx> WispRuntime<'ectx> {
     pub fn init(device: ConfiguredAudioDevice, midi_in: WispMidiIn) -> Self {
-        let (runtime_tx, runtime_rx) = crossbeam::channel::bounded(0);
+        // Buffered so that senders don't block until the audio/MIDI callbacks poll
+        let (runtime_tx, runtime_rx) = crossbeam::channel::bounded(64);
         let (runtime_result_tx, runtime_result_rx) = crossbeam::channel::bounded(0);
-        let (midi_state_tx, midi_state_rx) = crossbeam::channel::bounded(0);
+        let (midi_state_tx, midi_state_rx) = crossbeam::channel::bounded(64);
 
         let midi_state = MidiState::new(runtime_tx.clone());
         let midi_in_connection = midi_in
@@ -155,7 +157,7 @@ impl<'ectx> WispRuntime<'ectx> {
         };
         let stream = device
             .build_output_audio_stream(move |_num_outputs: u32, buffer: &mut [f32]| {
-                if let Ok(message) = runtime_rx.try_recv() {
+                while let Ok(message) = runtime_rx.try_recv() {
                     match message {
                         RuntimeStateMessage::StartDsp => {
                             runtime_state.is_running = true;
@@ -177,6 +179,7 @@ impl<'ectx> WispRuntime<'ectx> {
                                 }
                             }
                             runtime_state.processor = Some(sp);
+                            runtime_result_tx.send(SignalProcessorResponse::Ack).unwrap();
                         }
                         RuntimeStateMessage::SetDataValue(name, id, idx, value) => {
                             if let Some(sp) = runtime_state.processor.as_mut() {
@@ -226,9 +229,7 @@ impl<'ectx> WispRuntime<'ectx> {
                     }
                 } else {
                     // Silence if no signal processor
-                    for b in buffer.iter_mut() {
-                        *b = 0.0;
-                    }
+                    buffer.fill(0.0);
                 }
             })
             .expect("Failed to create an audio stream");
@@ -267,6 +268,12 @@ impl<'ectx> WispRuntime<'ectx> {
         self.runtime_tx
             .send(RuntimeStateMessage::SetProcessor(sp))
             .expect("The processor channel is disconnected");
+        // Wait until the audio thread has installed the new processor before
+        // dropping the old execution engine that owns the current JIT'd code
+        match self.runtime_result_rx.recv().unwrap() {
+            SignalProcessorResponse::Ack => {}
+            _ => unreachable!(),
+        }
         self.ee_ref = Some(ee);
         Ok(())
     }
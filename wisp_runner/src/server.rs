@@ -22,6 +22,8 @@ pub fn main(
     let input = std::io::stdin();
     let output = std::io::stdout();
     let mut line = String::new();
+    // Tracks whether the context changed since the last processor rebuild
+    let mut context_dirty = true;
     loop {
         line.clear();
         input.read_line(&mut line)?;
@@ -53,20 +55,26 @@ pub fn main(
             }
             WispCommand::ContextReset => {
                 wisp.reset();
+                context_dirty = true;
                 reply(&output, WispCommandResponse::Ok(()))
             }
             WispCommand::ContextAddOrUpdateFunctions(functions) => {
                 for func in functions {
                     wisp.add_function(func);
                 }
+                context_dirty = true;
                 reply(&output, WispCommandResponse::Ok(()))
             }
             WispCommand::ContextRemoveFunction(name) => {
                 wisp.remove_function(&name);
+                context_dirty = true;
                 reply(&output, WispCommandResponse::Ok(()))
             }
             WispCommand::ContextSetMainFunction(name) => {
-                wisp.set_main_function(&name);
+                if name != wisp.main_function() {
+                    wisp.set_main_function(&name);
+                    context_dirty = true;
+                }
                 reply(&output, WispCommandResponse::Ok(()))
             }
             WispCommand::ContextSetDataValue(name, id, idx, value) => {
@@ -117,11 +125,16 @@ pub fn main(
                 reply(&output, WispCommandResponse::Ok(()))
             }
             WispCommand::ContextUpdate => {
-                runtime.switch_to_signal_processor(
-                    &execution_context,
-                    &wisp,
-                    wisp.main_function(),
-                )?;
+                if context_dirty {
+                    runtime.switch_to_signal_processor(
+                        &execution_context,
+                        &wisp,
+                        wisp.main_function(),
+                    )?;
+                    context_dirty = false;
+                } else {
+                    info!("Context is unchanged - keeping the current signal processor");
+                }
                 reply(&output, WispCommandResponse::Ok(()))
             }
         }?;